@@ -251,11 +251,7 @@ with D:
 
     if st.button("Run GenAI", key="genai"):
         out = local_gen(provider, task)
-        # Check if the output is a multi-step process
-        if out:
-            pass # The function already handles displaying output
-        else:
-            st.markdown(out)
+        st.markdown(out)
 
     st.markdown("**Optimization knobs**: batch size, max tokens, temperature; **Cost model**: requests × unit price; **Guardrails**: PII scrubbing, rate limits.")
 
@@ -278,8 +274,10 @@ with E:
                 "post": {"summary": f"Create {r[:-1]}", "security": [{auth: []}], "responses": {"201": {"description": "Created"}}}
             }
         oas = {"openapi": "3.0.0", "info": {"title": "Demo API", "version": "1.0.0"}, "x-gateway": {"rate_limit_rpm": rate}, "paths": paths}
-        st.json(oas)
-        st.download_button("Download openapi.json", data=json.dumps(oas, indent=2), file_name="openapi.json")
+        # Serialize once and reuse the text for both the viewer and the download
+        oas_json = json.dumps(oas, indent=2)
+        st.json(oas_json)
+        st.download_button("Download openapi.json", data=oas_json, file_name="openapi.json")
 
     st.markdown("**Gateway design**: WAF rules, JWT validation, IP allowlists, CORS, request/response transforms, canary routing.")
 
@@ -292,6 +290,7 @@ with E:
         ax.set_xlabel('Minute')
         ax.set_ylabel('p95 latency (ms)')
         st.pyplot(fig)
+        plt.close(fig)
 
 # ======================================================================
 # ------------ Tab F: EA & Security Compliance -------------------------